@@ -0,0 +1,469 @@
+"""
+Inference Benchmark Suite
+=========================
+This module measures prediction performance of the trained ensemble so
+that retrains and library upgrades that slow down scoring are caught
+before deployment.
+
+Measurements:
+- Cold start: fresh Python process running predict.py (as the backend does)
+- Warm latency: single-row predictions with artifacts already loaded
+- Batch throughput: rows/second at batch sizes 1, 10, 100, 1,000, 3,000 and 10,000
+- Peak memory: Python heap peak per inference path and process peak RSS
+- What-if scenarios: a 10,000-point run_scenarios grid with artifacts
+  preloaded (checked against the interactive target) and a cold scenario.py run
+
+Every run is written as versioned JSON to benchmarks/inference_<stamp>.json
+(git-ignored). --save-baseline stores the run as benchmarks/baseline.json,
+which --compare checks against by default. No baseline ships with the
+repository: record one on the deployment host before using --compare.
+
+Usage:
+    python benchmark_inference.py --save-baseline   # after an accepted retrain/upgrade
+    python benchmark_inference.py --compare         # before deployment
+
+Author: HackX ML Team
+Date: January 2026
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from parallel_ensemble import predict_proba_parallel
+from scenario import run_scenarios
+
+# Suppress minor warnings for cleaner output
+warnings.filterwarnings('ignore')
+
+# Configuration
+BENCHMARK_SCHEMA_VERSION = '1.0'
+RANDOM_STATE = 42
+BATCH_SIZES = [1, 10, 100, 1000, 3000, 10000]  # 1000/3000 locate the serial/parallel crossover
+COLD_START_RUNS = 3
+WARM_RUNS = 200
+MIN_BATCH_SECONDS = 0.5  # Repeat each batch until at least this much time has passed
+SCENARIO_RUNS = 10
+INTERACTIVE_TARGET_S = 1.0  # What-if answers must come back well under a second
+REGRESSION_TOLERANCE = 0.20  # 20% slower than the baseline counts as a regression
+# Smaller absolute changes are run-to-run noise and never count as regressions
+MIN_COLD_START_CHANGE_S = 0.05
+MIN_LATENCY_CHANGE_MS = 0.5
+MIN_MEMORY_CHANGE_MB = 1.0
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(CURRENT_DIR, 'benchmarks')
+BASELINE_PATH = os.path.join(RESULTS_DIR, 'baseline.json')
+
+# 100 x 100 = 10,000 grid points for the what-if scenario benchmark
+SCENARIO_GRID = {
+    'open_sanitation_complaints': {'min': 0, 'max': 99, 'steps': 100},
+    'max_pm25_last_7d': {'min': 50, 'max': 400, 'steps': 100},
+}
+
+# Inference paths under test: name -> callable(model, X_scaled) returning probabilities
+INFERENCE_PATHS = {
+    'voting_serial': lambda model, X: model.predict_proba(X),
+    'voting_parallel': lambda model, X: predict_proba_parallel(model, X),
+    'voting_parallel_forced': lambda model, X: predict_proba_parallel(model, X, min_parallel_rows=0),
+}
+
+
+def load_benchmark_artifacts():
+    """
+    Load model, scaler, metadata and feature schema
+
+    Returns:
+        tuple: (model, scaler, metadata, schema)
+    """
+    model = joblib.load(os.path.join(CURRENT_DIR, 'outbreak_model.pkl'))
+    scaler = joblib.load(os.path.join(CURRENT_DIR, 'scaler.pkl'))
+
+    with open(os.path.join(CURRENT_DIR, 'model_metadata.json')) as f:
+        metadata = json.load(f)
+    with open(os.path.join(CURRENT_DIR, 'feature_schema.json'), encoding='utf-8') as f:
+        schema = json.load(f)
+
+    return model, scaler, metadata, schema
+
+
+def make_feature_batch(schema, feature_names, n_rows, rng):
+    """
+    Draw synthetic feature rows from each feature's typical range
+
+    Returns:
+        pd.DataFrame: Unscaled features in model column order
+    """
+    specs = {feature['name']: feature for feature in schema['features']}
+    columns = {}
+
+    for name in feature_names:
+        low, high = (float(v) for v in specs[name]['typical_range'].split('-'))
+        values = rng.uniform(low, high, size=n_rows)
+        if specs[name]['data_type'] == 'integer':
+            values = np.round(values)
+        columns[name] = values
+
+    return pd.DataFrame(columns, columns=feature_names)
+
+
+def benchmark_cold_start(payload, script_name='predict.py', runs=COLD_START_RUNS):
+    """
+    Time a script end to end in a fresh interpreter, as the backend calls it
+
+    Args:
+        payload: JSON-serializable input written to the script's stdin
+
+    Returns:
+        dict: Wall-clock seconds per run with median and min
+    """
+    print(f"🧊 Cold start ({runs} runs of {script_name})...")
+    script_path = os.path.join(CURRENT_DIR, script_name)
+    payload = json.dumps(payload)
+    timings = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, script_path],
+            input=payload, capture_output=True, text=True
+        )
+        timings.append(time.perf_counter() - start)
+
+        if completed.returncode != 0:
+            raise RuntimeError(f"{script_name} failed: {completed.stdout}{completed.stderr}")
+
+    result = {
+        'runs_s': timings,
+        'median_s': statistics.median(timings),
+        'min_s': min(timings)
+    }
+    print(f"✓ Cold start median: {result['median_s'] * 1000:.1f} ms")
+    return result
+
+
+def benchmark_warm_latency(path_fn, model, scaler, row_df, runs=WARM_RUNS):
+    """
+    Time single-row scaling + prediction with artifacts already in memory
+
+    Returns:
+        dict: Latency percentiles in milliseconds
+    """
+    path_fn(model, scaler.transform(row_df))  # Warm-up call
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        path_fn(model, scaler.transform(row_df))
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        'runs': runs,
+        'p50_ms': timings[len(timings) // 2],
+        'p95_ms': timings[int(len(timings) * 0.95) - 1],
+        'mean_ms': statistics.mean(timings)
+    }
+
+
+def benchmark_batch_throughput(path_fn, model, X_scaled):
+    """
+    Time repeated predictions on one scaled batch
+
+    Returns:
+        dict: Seconds per batch and rows per second
+    """
+    path_fn(model, X_scaled)  # Warm-up call
+
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < MIN_BATCH_SECONDS:
+        path_fn(model, X_scaled)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+
+    seconds_per_batch = elapsed / iterations
+    return {
+        'iterations': iterations,
+        'seconds_per_batch': seconds_per_batch,
+        'rows_per_second': X_scaled.shape[0] / seconds_per_batch
+    }
+
+
+def benchmark_scenarios(model, scaler, base, grid=SCENARIO_GRID, runs=SCENARIO_RUNS):
+    """
+    Time run_scenarios end to end on a what-if grid with artifacts preloaded
+
+    Returns:
+        dict: Grid size, latency in milliseconds and whether the interactive target is met
+    """
+    result = run_scenarios(base, grid=grid, model=model, scaler=scaler)  # Warm-up call
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_scenarios(base, grid=grid, model=model, scaler=scaler)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    p50_ms = statistics.median(timings)
+    return {
+        'grid_points': result['n_scenarios'],
+        'runs': runs,
+        'p50_ms': p50_ms,
+        'max_ms': max(timings),
+        'target_ms': INTERACTIVE_TARGET_S * 1000,
+        'within_target': p50_ms <= INTERACTIVE_TARGET_S * 1000
+    }
+
+
+def measure_peak_memory(path_fn, model, X_scaled):
+    """
+    Peak Python heap allocation while scoring one batch
+
+    Native allocations inside the boosting libraries are not traced;
+    see process_peak_rss_mb in the results for the whole-process figure.
+
+    Returns:
+        float: Peak traced memory in MB
+    """
+    tracemalloc.start()
+    path_fn(model, X_scaled)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def get_process_peak_rss_mb():
+    """Peak resident set size of this process in MB, or None if unavailable"""
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def get_environment_info(metadata):
+    """
+    Versions that can change scoring speed, recorded with every result
+
+    Returns:
+        dict: Python, library and model versions plus host details
+    """
+    versions = {}
+    for package in ['numpy', 'pandas', 'sklearn', 'joblib', 'xgboost', 'lightgbm', 'catboost']:
+        try:
+            versions[package] = __import__(package).__version__
+        except ImportError:
+            versions[package] = None
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'libraries': versions,
+        'model_type': metadata.get('model_type'),
+        'model_timestamp': metadata.get('timestamp')
+    }
+
+
+def run_benchmarks(include_cold_start=True):
+    """
+    Run the full benchmark suite
+
+    Returns:
+        dict: Versioned benchmark results
+    """
+    model, scaler, metadata, schema = load_benchmark_artifacts()
+    feature_names = metadata['feature_names']
+    rng = np.random.default_rng(RANDOM_STATE)
+
+    example_features = schema['integration_example']['payload']['features']
+    example_row = pd.DataFrame([example_features])[feature_names]
+
+    results = {
+        'schema_version': BENCHMARK_SCHEMA_VERSION,
+        'timestamp': pd.Timestamp.now().isoformat(),
+        'environment': get_environment_info(metadata),
+        'cold_start': benchmark_cold_start(example_features) if include_cold_start else None,
+        'paths': {}
+    }
+
+    batches = {
+        size: scaler.transform(make_feature_batch(schema, feature_names, size, rng))
+        for size in BATCH_SIZES
+    }
+
+    for name, path_fn in INFERENCE_PATHS.items():
+        print(f"\n⏱️  Inference path: {name}")
+        warm = benchmark_warm_latency(path_fn, model, scaler, example_row)
+        print(f"  Warm single-row p50: {warm['p50_ms']:.2f} ms (p95 {warm['p95_ms']:.2f} ms)")
+
+        batch_results = {}
+        for size, X_scaled in batches.items():
+            throughput = benchmark_batch_throughput(path_fn, model, X_scaled)
+            throughput['peak_traced_mb'] = measure_peak_memory(path_fn, model, X_scaled)
+            batch_results[str(size)] = throughput
+            print(f"  Batch {size:>6}: {throughput['rows_per_second']:>12,.0f} rows/s, "
+                  f"peak {throughput['peak_traced_mb']:.1f} MB")
+
+        results['paths'][name] = {
+            'warm_single_row': warm,
+            'batches': batch_results
+        }
+
+    print("\n🔮 What-if scenarios")
+    scenarios = {'warm': benchmark_scenarios(model, scaler, example_features)}
+    warm = scenarios['warm']
+    status = "✓" if warm['within_target'] else "⚠️  over target"
+    print(f"  {warm['grid_points']:,}-point grid p50: {warm['p50_ms']:.0f} ms "
+          f"(target {warm['target_ms']:.0f} ms) {status}")
+    if include_cold_start:
+        scenarios['cold_start'] = benchmark_cold_start(
+            {'base': example_features, 'grid': SCENARIO_GRID}, script_name='scenario.py'
+        )
+    results['scenarios'] = scenarios
+
+    results['process_peak_rss_mb'] = get_process_peak_rss_mb()
+    return results
+
+
+def save_results(results, output_path=None):
+    """
+    Write results to benchmarks/inference_<timestamp>.json (or output_path)
+
+    Returns:
+        str: Path of the written file
+    """
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    if output_path is None:
+        stamp = pd.Timestamp(results['timestamp']).strftime('%Y%m%d_%H%M%S')
+        output_path = os.path.join(RESULTS_DIR, f'inference_{stamp}.json')
+
+    with open(output_path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    return output_path
+
+
+def compare_results(current, baseline, tolerance=REGRESSION_TOLERANCE):
+    """
+    Find measurements that got slower (or used more memory) than the
+    baseline by more than tolerance
+
+    A change only counts if it is also larger than the absolute floor for
+    its unit (MIN_*_CHANGE_*), so sub-millisecond timings and small heap
+    peaks at tiny batch sizes do not fail on run-to-run noise.
+
+    Returns:
+        list: Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+
+    def check(label, new_value, old_value, min_change):
+        if new_value is None or not old_value:
+            return
+        ratio = new_value / old_value
+        if ratio > 1 + tolerance and new_value - old_value > min_change:
+            regressions.append(f"{label}: {old_value:.4g} -> {new_value:.4g} ({(ratio - 1) * 100:.0f}% worse)")
+
+    if current.get('cold_start') and baseline.get('cold_start'):
+        check('cold_start median_s', current['cold_start']['median_s'], baseline['cold_start']['median_s'],
+              MIN_COLD_START_CHANGE_S)
+
+    for name, path in current['paths'].items():
+        old_path = baseline.get('paths', {}).get(name)
+        if old_path is None:
+            continue
+
+        check(f"{name} warm p50_ms", path['warm_single_row']['p50_ms'], old_path['warm_single_row']['p50_ms'],
+              MIN_LATENCY_CHANGE_MS)
+
+        for size, batch in path['batches'].items():
+            old_batch = old_path['batches'].get(size)
+            if old_batch is not None:
+                # Compared as time per batch so the latency floor applies to throughput too
+                check(f"{name} batch {size} ms_per_batch",
+                      batch['seconds_per_batch'] * 1000, old_batch['seconds_per_batch'] * 1000,
+                      MIN_LATENCY_CHANGE_MS)
+                check(f"{name} batch {size} peak_traced_mb",
+                      batch['peak_traced_mb'], old_batch.get('peak_traced_mb'), MIN_MEMORY_CHANGE_MB)
+
+    scenarios = current.get('scenarios', {})
+    old_scenarios = baseline.get('scenarios', {})
+    if scenarios.get('warm'):
+        if not scenarios['warm']['within_target']:
+            regressions.append(f"scenario grid p50_ms {scenarios['warm']['p50_ms']:.0f} exceeds "
+                               f"the {scenarios['warm']['target_ms']:.0f} ms interactive target")
+        if old_scenarios.get('warm'):
+            check('scenario grid p50_ms', scenarios['warm']['p50_ms'], old_scenarios['warm']['p50_ms'],
+                  MIN_LATENCY_CHANGE_MS)
+    if scenarios.get('cold_start') and old_scenarios.get('cold_start'):
+        check('scenario cold_start median_s', scenarios['cold_start']['median_s'],
+              old_scenarios['cold_start']['median_s'], MIN_COLD_START_CHANGE_S)
+
+    check('process_peak_rss_mb', current.get('process_peak_rss_mb'), baseline.get('process_peak_rss_mb'),
+          MIN_MEMORY_CHANGE_MB)
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark outbreak model inference')
+    parser.add_argument('--compare', nargs='?', const=BASELINE_PATH,
+                        help='Results JSON to check for regressions (default: benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Also store this run as benchmarks/baseline.json')
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help='Allowed slowdown or memory growth before failing (default: 0.20)')
+    parser.add_argument('--skip-cold-start', action='store_true',
+                        help='Skip the fresh-process predict.py measurement')
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("🚀 OUTBREAK PREDICTION: INFERENCE BENCHMARKS")
+    print("="*60 + "\n")
+
+    results = run_benchmarks(include_cold_start=not args.skip_cold_start)
+    output_path = save_results(results)
+    print(f"\n💾 Saved benchmark results to {output_path}")
+
+    if args.compare:
+        if not os.path.exists(args.compare):
+            print(f"❌ No baseline at {args.compare}; create one with --save-baseline")
+            sys.exit(1)
+
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} REGRESSION(S) vs {args.compare}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+
+        print(f"\n✅ No regressions vs {args.compare}")
+
+    if args.save_baseline:
+        save_results(results, BASELINE_PATH)
+        print(f"📌 Saved baseline to {BASELINE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ import os
 # Configuration
 DATA_DIR = '../backend/data'
 OUTBREAK_THRESHOLD = 5  # Cases in next 7 days to classify as outbreak
+OUTBREAK_HORIZON = 7  # Days ahead covered by the outbreak target
 
 def load_datasets():
     """
@@ -244,6 +245,104 @@ def engineer_environmental_features(environmental_df, grid):
     return features_df
 
 
+def get_label_column(threshold, horizon, disease=None):
+    """
+    Column name for one (threshold, horizon, disease) outbreak label
+
+    Examples: outbreak_h7_t5, outbreak_dengue_h14_t3
+    """
+    disease_part = f"_{disease.lower()}" if disease else ""
+    return f"outbreak{disease_part}_h{horizon}_t{threshold}"
+
+
+def compute_forward_counts(health_df, grid, horizons, diseases):
+    """
+    Count health incidents in the next N days for every grid row
+
+    Events are sorted once by (area, day); each area's events are then a
+    contiguous slice, and every grid row's forward window is counted with
+    two binary searches instead of filtering health_df per area or row.
+
+    Args:
+        horizons: Forward window lengths in days, e.g. [3, 7, 14]
+        diseases: diseaseType values to count separately (None = all diseases)
+
+    Returns:
+        dict: {(disease, horizon): np.ndarray of counts aligned with grid rows}
+    """
+    # Whole days since epoch, matching the day-level comparison of dates
+    grid_days = grid['date'].values.astype('datetime64[D]').astype(np.int64)
+    event_days = health_df['reportedDate'].values.astype('datetime64[D]').astype(np.int64)
+
+    # Single sort of all events by area code, then day
+    event_codes, event_area_names = pd.factorize(health_df['area'])
+    order = np.lexsort((event_days, event_codes))
+    event_codes = event_codes[order]
+    event_days = event_days[order]
+    event_diseases = health_df['diseaseType'].values[order]
+    area_codes = {area: code for code, area in enumerate(event_area_names)}
+
+    counts = {
+        (disease, horizon): np.zeros(len(grid), dtype=np.int64)
+        for disease in diseases for horizon in horizons
+    }
+
+    for area, rows in grid.groupby('area', sort=False).indices.items():
+        if area not in area_codes:
+            continue  # No incidents in this area: counts stay 0
+
+        code = area_codes[area]
+        start = np.searchsorted(event_codes, code, side='left')
+        end = np.searchsorted(event_codes, code, side='right')
+        area_days = event_days[start:end]
+        area_diseases = event_diseases[start:end]
+        current_days = grid_days[rows]
+
+        for disease in diseases:
+            # Masking a sorted slice keeps it sorted
+            sorted_days = area_days if disease is None else area_days[area_diseases == disease]
+
+            # Events on or before the current day are excluded from the window
+            seen = np.searchsorted(sorted_days, current_days, side='right')
+            for horizon in horizons:
+                window_end = np.searchsorted(sorted_days, current_days + horizon, side='right')
+                counts[(disease, horizon)][rows] = window_end - seen
+
+    return counts
+
+
+def create_target_labels(health_df, grid, thresholds=(OUTBREAK_THRESHOLD,),
+                         horizons=(OUTBREAK_HORIZON,), diseases=(None,)):
+    """
+    Create outbreak labels for every (threshold, horizon, disease) combination
+
+    Forward-window counts are computed once per (disease, horizon); each
+    threshold is then a single vectorized comparison, so ten label sets
+    cost about the same as one.
+
+    Outbreak definition (per label):
+    - 1 if incidents of the disease in the next `horizon` days > threshold
+    - 0 otherwise
+
+    Args:
+        thresholds: Case-count thresholds, e.g. [3, 5, 10]
+        horizons: Forward window lengths in days, e.g. [3, 7, 14]
+        diseases: diseaseType values, None for all diseases combined
+
+    Returns:
+        pd.DataFrame: Grid [area, date] with one column per label (see get_label_column)
+    """
+    counts = compute_forward_counts(health_df, grid, horizons, diseases)
+
+    labels = {
+        get_label_column(threshold, horizon, disease): (counts[(disease, horizon)] > threshold).astype(np.int64)
+        for disease in diseases for horizon in horizons for threshold in thresholds
+    }
+
+    labels_df = pd.DataFrame(labels, index=grid.index)
+    return pd.concat([grid[['area', 'date']], labels_df], axis=1)
+
+
 def create_target_variable(health_df, grid):
     """
     Create target variable: outbreak in next 7 days
@@ -257,33 +356,9 @@ def create_target_variable(health_df, grid):
     """
     print(f"🎯 Creating target variable (threshold={OUTBREAK_THRESHOLD} cases)...")
     
-    health_df = health_df.copy()
-    health_df['date'] = health_df['reportedDate'].dt.date
-    
-    targets = []
-    
-    for _, row in grid.iterrows():
-        area = row['area']
-        current_date = row['date'].date()
-        
-        # Next 7 days window
-        end_date = current_date + timedelta(days=7)
-        
-        future_incidents = health_df[
-            (health_df['area'] == area) & 
-            (health_df['date'] > current_date) & 
-            (health_df['date'] <= end_date)
-        ]
-        
-        outbreak = 1 if len(future_incidents) > OUTBREAK_THRESHOLD else 0
-        
-        targets.append({
-            'area': area,
-            'date': row['date'],
-            'outbreak': outbreak
-        })
-    
-    targets_df = pd.DataFrame(targets)
+    targets_df = create_target_labels(health_df, grid).rename(
+        columns={get_label_column(OUTBREAK_THRESHOLD, OUTBREAK_HORIZON): 'outbreak'}
+    )
     
     outbreak_count = targets_df['outbreak'].sum()
     print(f"✓ Created target: {outbreak_count} outbreaks ({outbreak_count/len(targets_df)*100:.1f}%)")
@@ -0,0 +1,276 @@
+"""
+Parallel Soft-Voting Inference
+==============================
+This module scores the members of the soft-voting ensemble concurrently.
+
+XGBoost, LightGBM and CatBoost release the GIL inside their native
+predictors, so running each member's predict_proba on its own thread
+overlaps most of the work on multi-core hosts. While the pool runs, each
+member's own native threads are capped at cpu_count // n_workers so the
+members share the cores instead of oversubscribing them. The loaded model
+is never modified to do this, so concurrent callers can share it.
+
+Whether a batch is worth a thread pool is decided from measured numbers:
+the crossover batch size where the parallel path beats the serial one in
+benchmarks/baseline.json (written by benchmark_inference.py --save-baseline),
+interpolated between the measured batch sizes. Until a baseline has been
+saved on the host, an unmeasured default of 2000 rows is used.
+
+The averaged probabilities are identical to VotingClassifier.predict_proba.
+
+Author: HackX ML Team
+Date: January 2026
+"""
+
+import copy
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+# Configuration
+DEFAULT_PARALLEL_MIN_ROWS = 2000  # Unmeasured; used until a benchmark baseline exists for this host
+MAX_WORKERS = os.cpu_count() or 1
+BENCHMARK_BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'baseline.json'
+)
+
+# Loaded from the benchmark baseline on first use (see get_parallel_min_rows)
+_parallel_min_rows = None
+
+# Thread-limited copies of members that keep their thread count on the estimator
+_limited_members = {}
+_limited_members_lock = threading.Lock()
+
+
+def load_parallel_min_rows(baseline_path=BENCHMARK_BASELINE_PATH, default=DEFAULT_PARALLEL_MIN_ROWS):
+    """
+    Batch size at which parallel scoring starts to beat serial scoring
+
+    Compares 'voting_serial' and 'voting_parallel_forced' throughput in the
+    benchmark baseline and interpolates (on a log scale) between the last
+    batch size where serial won and the first size from which parallel wins
+    at every larger size. The baseline is only trusted if it was recorded
+    on a host with the same CPU count.
+
+    Returns:
+        float: Row threshold (inf if parallel never won, default if no usable baseline)
+    """
+    try:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        if baseline['environment']['cpu_count'] != os.cpu_count():
+            return default
+        serial = baseline['paths']['voting_serial']['batches']
+        parallel = baseline['paths']['voting_parallel_forced']['batches']
+    except (OSError, ValueError, KeyError):
+        return default
+
+    sizes = sorted(int(size) for size in serial if size in parallel)
+    if not sizes:
+        return default
+
+    # Relative advantage of the parallel path at each measured size
+    gains = [
+        parallel[str(size)]['rows_per_second'] / serial[str(size)]['rows_per_second'] - 1
+        for size in sizes
+    ]
+
+    if gains[-1] <= 0:
+        return float('inf')
+
+    # First index of the trailing run where parallel always wins
+    first_win = len(sizes) - 1
+    while first_win > 0 and gains[first_win - 1] > 0:
+        first_win -= 1
+
+    if first_win == 0:
+        return sizes[0]
+
+    low_size, high_size = sizes[first_win - 1], sizes[first_win]
+    low_gain, high_gain = gains[first_win - 1], gains[first_win]
+    fraction = low_gain / (low_gain - high_gain)
+    log_crossover = math.log(low_size) + fraction * (math.log(high_size) - math.log(low_size))
+    return math.ceil(math.exp(log_crossover))
+
+
+def get_parallel_min_rows():
+    """Parallel threshold from the benchmark baseline, read once on first use"""
+    global _parallel_min_rows
+    if _parallel_min_rows is None:
+        _parallel_min_rows = load_parallel_min_rows()
+    return _parallel_min_rows
+
+
+def get_voting_members(model):
+    """
+    Get the fitted members of a VotingClassifier and their voting weights
+
+    Members dropped with 'drop' are skipped, matching how the
+    VotingClassifier itself averages probabilities.
+
+    Returns:
+        tuple: (list of fitted estimators, list of weights or None)
+    """
+    members = list(model.estimators_)
+
+    weights = None
+    if model.weights is not None:
+        weights = [
+            weight
+            for (_, estimator), weight in zip(model.estimators, model.weights)
+            if estimator != 'drop'
+        ]
+
+    return members, weights
+
+
+def get_member_threads(n_workers):
+    """Native threads each member may use when n_workers members run side by side"""
+    return max(1, MAX_WORKERS // max(1, n_workers))
+
+
+def is_catboost(estimator):
+    """CatBoost only reports explicitly set arguments in get_params, so detect it by type"""
+    return hasattr(estimator, 'get_cat_feature_indices')
+
+
+def is_lightgbm(estimator):
+    return type(estimator).__name__.startswith('LGBM')
+
+
+def is_xgboost(estimator):
+    return type(estimator).__name__.startswith('XGB')
+
+
+def get_thread_param(estimator):
+    """
+    Name of the constructor argument that sets an estimator's native threads
+
+    Returns:
+        str: 'thread_count' (CatBoost), 'n_jobs' (XGBoost, LightGBM, sklearn) or None
+    """
+    if is_catboost(estimator):
+        return 'thread_count'
+    if 'n_jobs' in estimator.get_params():
+        return 'n_jobs'
+    return None
+
+
+def set_member_threads(estimator, n_threads):
+    """Set an estimator's own native thread count. Works before and after fitting."""
+    thread_param = get_thread_param(estimator)
+    if thread_param is not None:
+        estimator.set_params(**{thread_param: n_threads})
+
+
+def restore_member_threads(estimator, original):
+    """
+    Undo set_member_threads on a fitted estimator
+
+    XGBoost skips None when pushing parameters into a fitted booster, and
+    CatBoost has no thread_count unless one was set, so an unset original
+    is restored as -1 (all cores) for the boosting libraries.
+    """
+    thread_param = get_thread_param(estimator)
+    if thread_param is None:
+        return
+    if original is None and (is_xgboost(estimator) or is_catboost(estimator)):
+        original = -1
+    estimator.set_params(**{thread_param: original})
+
+
+def get_thread_limited_member(member, n_threads):
+    """
+    Copy of a member with its n_jobs capped, built once and cached
+
+    XGBoost and the sklearn models read n_jobs from the estimator itself,
+    so limiting them in place would affect every other caller of the shared
+    model. The copy is scored instead and the original is left untouched.
+    """
+    key = (id(member), n_threads)
+    cached = _limited_members.get(key)
+    if cached is not None and cached[0] is member:
+        return cached[1]
+
+    limited = copy.deepcopy(member)
+    set_member_threads(limited, n_threads)
+
+    with _limited_members_lock:
+        # Keep a reference to the original so its id cannot be reused
+        _limited_members[key] = (member, limited)
+    return limited
+
+
+def predict_member_proba(member, X, n_threads):
+    """
+    Call one member's predict_proba with its native threads capped at n_threads
+
+    Returns:
+        np.ndarray: Class probabilities from this member
+    """
+    # CatBoost and LightGBM take the thread count per call
+    if is_catboost(member):
+        return member.predict_proba(X, thread_count=n_threads)
+    if is_lightgbm(member):
+        return member.predict_proba(X, num_threads=n_threads)
+
+    if get_thread_param(member) is not None:
+        return get_thread_limited_member(member, n_threads).predict_proba(X)
+
+    return member.predict_proba(X)
+
+
+def should_run_parallel(n_rows, n_members, max_workers=MAX_WORKERS, min_parallel_rows=None):
+    """
+    Decide whether a batch is large enough to be worth a thread pool
+
+    Returns:
+        bool: True if the members should be scored concurrently
+    """
+    # A single row never pays for a thread pool; deciding this up front also
+    # keeps predict.py cold starts from reading the benchmark baseline
+    if n_members <= 1 or max_workers <= 1 or n_rows <= 1:
+        return False
+
+    if min_parallel_rows is None:
+        min_parallel_rows = get_parallel_min_rows()
+    return n_rows >= min_parallel_rows
+
+
+def predict_proba_parallel(model, X, max_workers=None, min_parallel_rows=None):
+    """
+    Soft-voting predict_proba with the ensemble members run concurrently
+
+    Args:
+        model: Fitted VotingClassifier with voting='soft'
+        X: Scaled feature matrix
+        max_workers: Thread pool size (defaults to one thread per member, capped by CPU count)
+        min_parallel_rows: Batches with fewer rows are scored serially
+                           (defaults to the crossover from the benchmark baseline)
+
+    Returns:
+        np.ndarray: Class probabilities of shape (n_samples, n_classes)
+    """
+    if getattr(model, 'voting', None) != 'soft':
+        return model.predict_proba(X)
+
+    members, weights = get_voting_members(model)
+    n_rows = X.shape[0]
+
+    if max_workers is None:
+        max_workers = min(len(members), MAX_WORKERS)
+
+    if should_run_parallel(n_rows, len(members), max_workers, min_parallel_rows):
+        n_threads = get_member_threads(max_workers)
+        # threadpool_limits caps BLAS/OpenMP pools used outside the members' own settings
+        with threadpool_limits(limits=n_threads), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            probas = list(executor.map(lambda member: predict_member_proba(member, X, n_threads), members))
+    else:
+        probas = [member.predict_proba(X) for member in members]
+
+    return np.average(np.asarray(probas), axis=0, weights=weights)
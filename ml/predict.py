@@ -6,6 +6,8 @@ import numpy as np
 import os
 import warnings
 
+from parallel_ensemble import predict_proba_parallel
+
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
@@ -60,7 +62,7 @@ def predict(features):
         # Predict probability
         # Note: Some models (like VotingClassifier) might have predict_proba
         try:
-            probability = model.predict_proba(df_scaled)[0][1]
+            probability = predict_proba_parallel(model, df_scaled)[0][1]
         except:
             # Fallback if model doesn't support probability
             prediction = model.predict(df_scaled)[0]
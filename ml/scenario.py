@@ -0,0 +1,304 @@
+"""
+What-If Scenario Scoring
+========================
+This module answers sensitivity questions such as "what if open sanitation
+complaints are halved" or "what if PM2.5 spikes to 250" for one area.
+
+A base feature vector (the nine-feature schema) is combined with a grid or a
+list of perturbations. All scenarios are scaled and scored in a single
+vectorized batch through the scaler and ensemble, and returned as a
+response surface.
+
+Perturbation specs (per feature):
+- [v1, v2, ...]                      Absolute values
+- {"min": a, "max": b, "steps": n}   Evenly spaced absolute values
+- {"scale": [0.5, 1.0, 2.0]}         Multiples of the base value
+- {"delta": [-5, 0, 5]}              Offsets from the base value
+
+Usage (stdin JSON, like predict.py):
+    {"base": {...}, "grid": {"open_sanitation_complaints": {"scale": [0.5, 1.0]},
+                             "max_pm25_last_7d": [150, 250]}}
+    {"base": {...}, "scenarios": [{"max_pm25_last_7d": 250}, {...}]}
+
+Author: HackX ML Team
+Date: January 2026
+"""
+
+import sys
+import json
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from predict import load_artifacts
+from parallel_ensemble import predict_proba_parallel
+
+# Suppress warnings
+warnings.filterwarnings('ignore')
+
+# Configuration
+MAX_SCENARIOS = 50000  # Upper bound on scenarios scored in one request
+
+FEATURE_COLS = [
+    'health_incidents_last_7d',
+    'health_incidents_last_14d',
+    'dengue_incidents_last_7d',
+    'malaria_incidents_last_7d',
+    'open_sanitation_complaints',
+    'total_sanitation_complaints_last_7d',
+    'avg_pm25_last_7d',
+    'avg_pm10_last_7d',
+    'max_pm25_last_7d'
+]
+
+# Count features are rounded to whole incidents/complaints after perturbation
+INTEGER_FEATURES = FEATURE_COLS[:6]
+
+
+def get_base_vector(base):
+    """
+    Convert a base feature dictionary into a vector in model column order
+
+    Returns:
+        np.ndarray: Base features of shape (9,)
+    """
+    missing = [name for name in FEATURE_COLS if name not in base]
+    if missing:
+        raise ValueError(f"Base features missing: {', '.join(missing)}")
+
+    return np.array([float(base[name]) for name in FEATURE_COLS])
+
+
+def clean_values(name, values):
+    """
+    Keep perturbed values physically valid: non-negative, whole counts
+
+    Returns:
+        np.ndarray: Values exactly as they will be scored
+    """
+    values = np.maximum(values, 0)
+    if name in INTEGER_FEATURES:
+        values = np.round(values)
+    return values
+
+
+def get_spec_values(name, values):
+    """
+    Validate a list of values from a perturbation spec before converting it
+
+    Returns:
+        np.ndarray: Values as floats
+    """
+    if not isinstance(values, (list, tuple)):
+        raise ValueError(f"Perturbation values for {name} must be a list")
+    if len(values) > MAX_SCENARIOS:
+        raise ValueError(f"Perturbation for {name} has {len(values)} values, maximum is {MAX_SCENARIOS}")
+    return np.asarray(values, dtype=float)
+
+
+def get_spec_steps(name, steps):
+    """
+    Validate the number of steps of a min/max range before building it
+
+    Returns:
+        int: Number of evenly spaced values
+    """
+    if isinstance(steps, bool) or not isinstance(steps, (int, float)) or steps != int(steps):
+        raise ValueError(f"'steps' for {name} must be a whole number, got {steps!r}")
+    if steps < 1:
+        raise ValueError(f"'steps' for {name} must be at least 1, got {steps}")
+    if steps > MAX_SCENARIOS:
+        raise ValueError(f"'steps' for {name} is {steps}, maximum is {MAX_SCENARIOS}")
+    return int(steps)
+
+
+def expand_perturbation(name, spec, base_value):
+    """
+    Expand one feature's perturbation spec into the values to score
+
+    Values are cleaned (see clean_values) and values that collapse together
+    after rounding are kept once, so the returned axis is exactly what is
+    scored and never contains duplicate grid points.
+
+    Returns:
+        np.ndarray: Distinct candidate values for the feature, in spec order
+    """
+    if name not in FEATURE_COLS:
+        raise ValueError(f"Unknown feature: {name}")
+
+    if isinstance(spec, (list, tuple)):
+        values = get_spec_values(name, spec)
+    elif isinstance(spec, dict) and 'scale' in spec:
+        values = base_value * get_spec_values(name, spec['scale'])
+    elif isinstance(spec, dict) and 'delta' in spec:
+        values = base_value + get_spec_values(name, spec['delta'])
+    elif isinstance(spec, dict) and {'min', 'max', 'steps'} <= spec.keys():
+        steps = get_spec_steps(name, spec['steps'])
+        values = np.linspace(float(spec['min']), float(spec['max']), steps)
+    else:
+        raise ValueError(f"Invalid perturbation for {name}: {spec}")
+
+    if values.size == 0:
+        raise ValueError(f"Perturbation for {name} has no values")
+
+    values = clean_values(name, values)
+    _, first_idx = np.unique(values, return_index=True)
+    return values[np.sort(first_idx)]
+
+
+def build_grid_matrix(base_vector, grid):
+    """
+    Build the full cartesian product of the perturbed features
+
+    Returns:
+        tuple: (axes dict {feature: values}, feature matrix of shape (n, 9))
+    """
+    if not grid:
+        raise ValueError("Grid must perturb at least one feature")
+
+    axes = {
+        name: expand_perturbation(name, spec, base_vector[FEATURE_COLS.index(name)])
+        for name, spec in grid.items()
+    }
+
+    n_scenarios = int(np.prod([len(values) for values in axes.values()]))
+    if n_scenarios > MAX_SCENARIOS:
+        raise ValueError(f"Grid has {n_scenarios} scenarios, maximum is {MAX_SCENARIOS}")
+
+    X = np.tile(base_vector, (n_scenarios, 1))
+    mesh = np.meshgrid(*axes.values(), indexing='ij')
+    for name, values in zip(axes, mesh):
+        X[:, FEATURE_COLS.index(name)] = values.ravel()
+
+    return axes, X
+
+
+def build_list_matrix(base_vector, scenarios):
+    """
+    Build one row per explicit scenario (features not listed keep base values)
+
+    Returns:
+        tuple: (overrides as scored, feature matrix of shape (n, 9))
+    """
+    if not scenarios:
+        raise ValueError("Scenario list is empty")
+    if len(scenarios) > MAX_SCENARIOS:
+        raise ValueError(f"Got {len(scenarios)} scenarios, maximum is {MAX_SCENARIOS}")
+
+    X = np.tile(base_vector, (len(scenarios), 1))
+    scored = []
+    for row, overrides in enumerate(scenarios):
+        cleaned = {}
+        for name, value in overrides.items():
+            if name not in FEATURE_COLS:
+                raise ValueError(f"Unknown feature: {name}")
+            cleaned[name] = float(clean_values(name, float(value)))
+            X[row, FEATURE_COLS.index(name)] = cleaned[name]
+        scored.append(cleaned)
+
+    return scored, X
+
+
+def score_matrix(model, scaler, X):
+    """
+    Scale and score a feature matrix in one vectorized batch
+
+    Returns:
+        np.ndarray: Outbreak probability per row
+    """
+    X_scaled = scaler.transform(pd.DataFrame(X, columns=FEATURE_COLS))
+    return predict_proba_parallel(model, X_scaled)[:, 1]
+
+
+def get_risk_level(prob):
+    """Risk label using the same cut-offs as predict.py"""
+    return "HIGH" if prob >= 0.7 else "MEDIUM" if prob >= 0.4 else "LOW"
+
+
+def get_risk_levels(probs):
+    """
+    Vectorized get_risk_level for a whole batch of probabilities
+
+    Returns:
+        np.ndarray: Risk label per probability
+    """
+    return np.select([probs >= 0.7, probs >= 0.4], ["HIGH", "MEDIUM"], default="LOW")
+
+
+def run_scenarios(base, grid=None, scenarios=None, model=None, scaler=None):
+    """
+    Score a what-if grid or scenario list against a base feature vector
+
+    Args:
+        base: Base feature dictionary (nine-feature schema)
+        grid: {feature: perturbation spec}, scored as a cartesian product
+        scenarios: List of {feature: value} overrides, scored row by row
+        model, scaler: Loaded artifacts (loaded from disk if not given)
+
+    Returns:
+        dict: Response surface with base probability and per-scenario
+              probabilities and risk levels. For a grid, "axes" holds the
+              values scored per feature and "probabilities"/"risk_levels"
+              are nested with one level per axis; for a list, "scenarios"
+              holds the overrides as scored and both are flat lists.
+    """
+    if (grid is None) == (scenarios is None):
+        raise ValueError("Provide exactly one of 'grid' or 'scenarios'")
+
+    if model is None or scaler is None:
+        model, scaler = load_artifacts()
+
+    base_vector = get_base_vector(base)
+
+    if grid is not None:
+        axes, X = build_grid_matrix(base_vector, grid)
+    else:
+        scored_scenarios, X = build_list_matrix(base_vector, scenarios)
+
+    # Base vector is scored in the same batch as the scenarios
+    probs = score_matrix(model, scaler, np.vstack([base_vector, X]))
+    base_prob, probs = float(probs[0]), probs[1:]
+    risk_levels = get_risk_levels(probs)
+
+    result = {
+        "base_probability": base_prob,
+        "base_risk_level": get_risk_level(base_prob),
+        "n_scenarios": int(len(probs)),
+        "min_probability": float(probs.min()),
+        "max_probability": float(probs.max())
+    }
+
+    if grid is not None:
+        shape = [len(values) for values in axes.values()]
+        result["axes"] = {name: values.tolist() for name, values in axes.items()}
+        result["probabilities"] = probs.reshape(shape).tolist()
+        result["risk_levels"] = risk_levels.reshape(shape).tolist()
+    else:
+        result["scenarios"] = scored_scenarios
+        result["probabilities"] = probs.tolist()
+        result["risk_levels"] = risk_levels.tolist()
+
+    return result
+
+
+if __name__ == "__main__":
+    try:
+        # Read input from stdin
+        input_str = sys.stdin.read()
+        if not input_str:
+            raise ValueError("No input data received")
+
+        request = json.loads(input_str)
+
+        result = run_scenarios(
+            request.get('base', {}),
+            grid=request.get('grid'),
+            scenarios=request.get('scenarios')
+        )
+
+        print(json.dumps(result))
+
+    except Exception as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
@@ -24,6 +24,8 @@ import joblib
 import json
 import warnings
 
+from joblib import parallel_backend
+from threadpoolctl import threadpool_limits
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
@@ -38,11 +40,19 @@ from catboost import CatBoostClassifier
 # Local Import
 try:
     from data_preprocessing import preprocess_data
+    from parallel_ensemble import (
+        predict_proba_parallel, get_member_threads, get_thread_param,
+        set_member_threads, restore_member_threads
+    )
 except ImportError:
     # Fallback if running from root
     import sys
     sys.path.append('ml')
     from data_preprocessing import preprocess_data
+    from parallel_ensemble import (
+        predict_proba_parallel, get_member_threads, get_thread_param,
+        set_member_threads, restore_member_threads
+    )
 
 # Suppress minor warnings for cleaner output
 warnings.filterwarnings('ignore')
@@ -112,21 +122,39 @@ def train_ensemble_model(X_train, y_train):
         random_seed=RANDOM_STATE, verbose=0, auto_class_weights='Balanced'
     )
 
+    members = [
+        ('lr', log_reg),
+        ('rf', rf),
+        ('xgb', xgb),
+        ('lgbm', lgbm),
+        ('cat', cat)
+    ]
+
+    # Members train side by side, so each gets an equal share of the cores
+    # instead of every booster spawning one thread per core
+    member_threads = get_member_threads(len(members))
+    default_threads = [estimator.get_params().get(get_thread_param(estimator)) for _, estimator in members]
+    for _, estimator in members:
+        set_member_threads(estimator, member_threads)
+
     # Create Ensemble (Voting Classifier)
     print("🤝 Creating Voting Classifier (Soft Voting)...")
     ensemble = VotingClassifier(
-        estimators=[
-            ('lr', log_reg),
-            ('rf', rf),
-            ('xgb', xgb),
-            ('lgbm', lgbm),
-            ('cat', cat)
-        ],
-        voting='soft'  # Average probabilities
+        estimators=members,
+        voting='soft',  # Average probabilities
+        n_jobs=len(members)
     )
 
-    print("🚀 Training Ensemble Model...")
-    ensemble.fit(X_train, y_train)
+    print(f"🚀 Training Ensemble Model ({len(members)} members x {member_threads} threads)...")
+    # Threads instead of processes: the boosting libraries release the GIL,
+    # so members train side by side without copying the data to workers
+    with parallel_backend('threading', n_jobs=len(members)), threadpool_limits(limits=member_threads):
+        ensemble.fit(X_train, y_train)
+
+    # Restore default threading on the fitted members so serial inference
+    # (e.g. single-row predict.py calls) still uses every core
+    for fitted, original in zip(ensemble.estimators_, default_threads):
+        restore_member_threads(fitted, original)
     print("✓ Training completed")
     
     return ensemble
@@ -137,8 +165,8 @@ def evaluate_model(model, X_train, X_test, y_train, y_test, feature_names):
     print("="*60)
     
     y_test_pred = model.predict(X_test)
-    y_test_proba = model.predict_proba(X_test)[:, 1]
-    y_train_proba = model.predict_proba(X_train)[:, 1]
+    y_test_proba = predict_proba_parallel(model, X_test)[:, 1]
+    y_train_proba = predict_proba_parallel(model, X_train)[:, 1]
     
     metrics = {
         'train_roc_auc': roc_auc_score(y_train, y_train_proba),